@@ -189,21 +189,46 @@ def _inject_params(
         if header_args:
             injectors.append(HeadersGetter(header_args, default_value(header_args)))
 
-        if decorate_method:
+        # (inject, context, is_coroutine) of each injector, computed once
+        # for all requests.
+        injectors = [
+            (injector.inject, injector.context, iscoroutinefunction(injector.inject))
+            for injector in injectors
+        ]
+
+        if not injectors:
+            # Nothing to validate, the request goes straight to the handler.
+            if decorate_method:
+
+                async def wrapped_handler(self):
+                    return await handler_(self)
+
+            elif inject_request:
+
+                async def wrapped_handler(request):
+                    return await handler_(request)
+
+            else:
+
+                async def wrapped_handler(request):
+                    return await handler_()
+
+        elif decorate_method:
 
             async def wrapped_handler(self):
                 args = []
                 kwargs = {}
-                for injector in injectors:
-                    try:
-                        if iscoroutinefunction(injector.inject):
-                            await injector.inject(self.request, args, kwargs)
+                request = self.request
+                try:
+                    for inject, context, is_coroutine in injectors:
+                        if is_coroutine:
+                            await inject(request, args, kwargs)
                         else:
-                            injector.inject(self.request, args, kwargs)
-                    except ValidationError as error:
-                        return await getattr(
-                            self, "on_validation_error", on_validation_error
-                        )(error, injector.context)
+                            inject(request, args, kwargs)
+                except ValidationError as error:
+                    return await getattr(
+                        self, "on_validation_error", on_validation_error
+                    )(error, context)
                 return await handler(self, *args, **kwargs)
 
         elif inject_request:
@@ -211,14 +236,14 @@ def _inject_params(
             async def wrapped_handler(request):
                 args = [request]
                 kwargs = {}
-                for injector in injectors:
-                    try:
-                        if iscoroutinefunction(injector.inject):
-                            await injector.inject(request, args, kwargs)
+                try:
+                    for inject, context, is_coroutine in injectors:
+                        if is_coroutine:
+                            await inject(request, args, kwargs)
                         else:
-                            injector.inject(request, args, kwargs)
-                    except ValidationError as error:
-                        return await on_validation_error(error, injector.context)
+                            inject(request, args, kwargs)
+                except ValidationError as error:
+                    return await on_validation_error(error, context)
 
                 return await handler_(*args, **kwargs)
 
@@ -227,14 +252,14 @@ def _inject_params(
             async def wrapped_handler(request):
                 args = []
                 kwargs = {}
-                for injector in injectors:
-                    try:
-                        if iscoroutinefunction(injector.inject):
-                            await injector.inject(request, args, kwargs)
+                try:
+                    for inject, context, is_coroutine in injectors:
+                        if is_coroutine:
+                            await inject(request, args, kwargs)
                         else:
-                            injector.inject(request, args, kwargs)
-                    except ValidationError as error:
-                        return await on_validation_error(error, injector.context)
+                            inject(request, args, kwargs)
+                except ValidationError as error:
+                    return await on_validation_error(error, context)
 
                 return await handler_(*args, **kwargs)
 
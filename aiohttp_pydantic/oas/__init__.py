@@ -13,6 +13,7 @@ from .definition import (
     key_title_spec,
     key_security,
     key_display_configurations,
+    key_spec,
 )
 
 
@@ -49,6 +50,7 @@ def setup(
         oas_app[key_title_spec] = title_spec
         oas_app[key_security] = security
         oas_app[key_display_configurations] = json.dumps(display_configurations)
+        oas_app[key_spec] = {}
 
         oas_app.router.add_get("/spec", get_oas, name="spec")
         oas_app.router.add_static("/static", swagger_ui_path, name="static")
@@ -25,6 +25,7 @@ key_version_spec = web.AppKey("version spec", str)
 key_title_spec = web.AppKey("title spec", str)
 key_security = web.AppKey("security", dict)
 key_display_configurations = web.AppKey("key_display_configurations", dict)
+key_spec = web.AppKey("spec", dict)
 
 __all__ = [
     key_apps_to_expose,
@@ -32,5 +33,6 @@ __all__ = [
     key_version_spec,
     key_title_spec,
     key_security,
-    key_display_configurations
+    key_display_configurations,
+    key_spec,
 ]
@@ -168,6 +168,10 @@ class OperationObject:
     def __init__(self, spec: dict):
         self._spec = spec
 
+    @property
+    def spec(self) -> dict:
+        return self._spec
+
     @property
     def summary(self) -> str:
         return self._spec["summary"]
@@ -201,6 +205,10 @@ class OperationObject:
     def parameters(self) -> Parameters:
         return Parameters(self._spec)
 
+    @parameters.setter
+    def parameters(self, parameters: List[dict]):
+        self._spec["parameters"] = parameters
+
     @property
     def responses(self) -> Responses:
         return Responses(self._spec)
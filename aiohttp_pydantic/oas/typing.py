@@ -38,6 +38,16 @@ def is_status_code_type(obj) -> bool:
     return obj is _make_status_code_type(name)
 
 
+def _status_code_name(status_code_type) -> str:
+    """
+    Return the status code of a status code type, "200" for r200.
+    """
+    name = status_code_type.__name__
+    if name != "default":
+        name = name[1:]
+    return name
+
+
 def __getattr__(name):
     if (status_code_type := _make_status_code_type(name)) is None:
         raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,10 @@
 import typing
 import warnings
+from copy import deepcopy
 from inspect import getdoc, signature
-from itertools import count
-from typing import List, Optional, Type, get_type_hints
+from typing import List, Optional, Tuple, Type, get_type_hints
+from weakref import WeakKeyDictionary
 
-from aiohttp import hdrs
 from aiohttp.web import Response, json_response, View
 from aiohttp.web_app import Application
 from pydantic import RootModel
@@ -12,7 +12,7 @@ from pydantic import RootModel
 from ..injectors import _parse_func_signature
 from ..uploaded_file import UploadedFile
 from ..utils import is_pydantic_base_model, robuste_issubclass
-from ..view import PydanticView, is_pydantic_view
+from ..view import _METH_ALL_LOWER, PydanticView, is_pydantic_view
 from . import docstring_parser
 from .definition import (
     AIOHTTP_HAS_APP_KEY,
@@ -21,81 +21,152 @@ from .definition import (
     key_title_spec,
     key_version_spec,
     key_security,
-    key_display_configurations
+    key_display_configurations,
+    key_spec,
 )
 from .struct import OpenApiSpec3, OperationObject, PathItem
-from .typing import is_status_code_type
+from .typing import _status_code_name, is_status_code_type
 
 _APP_KEY_NOT_SET = object()
+_NO_DEFAULT = object()
+_REF_TEMPLATE = "#/components/schemas/{model}"
+_get_origin = typing.get_origin
+_get_args = typing.get_args
 
 
-class _OASResponseBuilder:
+# The schemas are built once per model, the models are weakly referenced
+# so that the cache does not keep them alive.
+_model_json_schemas: "WeakKeyDictionary[type, dict]" = WeakKeyDictionary()
+
+
+def _model_json_schema(model) -> dict:
     """
-    Parse the type annotated as returned by a function and
-    generate the OAS operation response.
+    Return the JSON schema of a pydantic model.
+
+    The schema is built once per model, the caller gets a copy that it can modify.
     """
+    try:
+        schema = _model_json_schemas[model]
+    except KeyError:
+        schema = _model_json_schemas[model] = model.model_json_schema(
+            ref_template=_REF_TEMPLATE
+        )
+    return deepcopy(schema)
 
-    def __init__(self, oas: OpenApiSpec3, oas_operation, status_code_descriptions):
-        self._oas_operation = oas_operation
-        self._oas = oas
-        self._status_code_descriptions = status_code_descriptions
-
-    def _handle_pydantic_base_model(self, obj):
-        if is_pydantic_base_model(obj):
-            response_schema = obj.model_json_schema(
-                ref_template="#/components/schemas/{model}"
-            ).copy()
-            if def_sub_schemas := response_schema.pop("$defs", None):
-                self._oas.components.schemas.update(def_sub_schemas)
-            return response_schema
-        return {}
-
-    def _handle_list(self, obj):
-        if typing.get_origin(obj) is list:
-            return {
-                "type": "array",
-                "items": self._handle_pydantic_base_model(typing.get_args(obj)[0]),
-            }
-        return self._handle_pydantic_base_model(obj)
-
-    def _handle_status_code_type(self, obj):
-        if is_status_code_type(typing.get_origin(obj)):
-            status_code = typing.get_origin(obj).__name__
-            if status_code != "default":
-                status_code = status_code[1:]
-            self._oas_operation.responses[status_code].content = {
-                "application/json": {
-                    "schema": self._handle_list(typing.get_args(obj)[0])
-                }
-            }
-            desc = self._status_code_descriptions.get(status_code)
-            if desc:
-                self._oas_operation.responses[status_code].description = desc
 
-        elif is_status_code_type(obj):
-            status_code = obj.__name__
-            if status_code != "default":
-                status_code = status_code[1:]
-            self._oas_operation.responses[status_code].content = {}
-            desc = self._status_code_descriptions.get(status_code)
-            if desc:
-                self._oas_operation.responses[status_code].description = desc
+def _parameter_json_schema(name: str, type_, default=_NO_DEFAULT) -> dict:
+    """
+    Return the JSON schema of a path, query string or header parameter.
+    """
+    attrs = {"__annotations__": {"root": type_}}
+    if default is not _NO_DEFAULT:
+        attrs["root"] = default
+    return type(name, (RootModel,), attrs).model_json_schema(
+        ref_template=_REF_TEMPLATE
+    )
+
 
-    def _handle_union(self, obj):
-        if typing.get_origin(obj) is typing.Union:
-            for arg in typing.get_args(obj):
-                self._handle_status_code_type(arg)
-        self._handle_status_code_type(obj)
+def _model_schema(components_schemas: dict, obj) -> dict:
+    if is_pydantic_base_model(obj):
+        response_schema = _model_json_schema(obj)
+        if def_sub_schemas := response_schema.pop("$defs", None):
+            components_schemas.update(def_sub_schemas)
+        return response_schema
+    return {}
 
-    def build(self, obj):
-        self._handle_union(obj)
 
+def _response_schema(components_schemas: dict, obj) -> dict:
+    """
+    Return the schema of the content of a response and collect its sub schemas.
+    """
+    if _get_origin(obj) is list:
+        return {
+            "type": "array",
+            "items": _model_schema(components_schemas, _get_args(obj)[0]),
+        }
+    return _model_schema(components_schemas, obj)
 
-def _add_http_method_to_oas(
-    oas: OpenApiSpec3, oas_path: PathItem, http_method: str, handler
+
+def _add_response_to_oas(
+    components_schemas: dict, oas_operation, status_code_descriptions, obj, origin
+):
+    if is_status_code_type(origin):
+        status_code = _status_code_name(origin)
+        content = {
+            "application/json": {
+                "schema": _response_schema(components_schemas, _get_args(obj)[0])
+            }
+        }
+    elif is_status_code_type(obj):
+        status_code = _status_code_name(obj)
+        content = {}
+    else:
+        return
+
+    response = oas_operation.responses[status_code]
+    response.content = content
+    desc = status_code_descriptions.get(status_code)
+    if desc:
+        response.description = desc
+
+
+def _add_responses_to_oas(
+    components_schemas: dict, oas_operation, status_code_descriptions, return_type
 ):
-    http_method = http_method.lower()
-    oas_operation: OperationObject = getattr(oas_path, http_method)
+    """
+    Parse the type annotated as returned by a function and
+    generate the OAS operation responses.
+    """
+    # Most return annotations are not an Union, a single attribute probe
+    # is enough to bail out without calling typing.get_origin.
+    if getattr(return_type, "__origin__", None) is typing.Union:
+        for arg in return_type.__args__:
+            _add_response_to_oas(
+                components_schemas,
+                oas_operation,
+                status_code_descriptions,
+                arg,
+                _get_origin(arg),
+            )
+    else:
+        _add_response_to_oas(
+            components_schemas,
+            oas_operation,
+            status_code_descriptions,
+            return_type,
+            _get_origin(return_type),
+        )
+
+
+# The handlers are weakly referenced so that the cache does not keep
+# the views and the handlers alive.
+_oas_operation_fragments: "WeakKeyDictionary[object, Tuple[dict, dict]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _oas_operation_fragment(handler) -> Tuple[dict, dict]:
+    """
+    Return the OAS operation of a handler and the sub schemas it refers to.
+
+    The fragment only depends on the handler, it is built once and spliced
+    in each generated specification.
+    """
+    try:
+        return _oas_operation_fragments[handler]
+    except KeyError:
+        fragment = _oas_operation_fragments[handler] = _build_oas_operation_fragment(
+            handler
+        )
+    except TypeError:  # The handler cannot be weakly referenced.
+        fragment = _build_oas_operation_fragment(handler)
+    return fragment
+
+
+def _build_oas_operation_fragment(handler) -> Tuple[dict, dict]:
+    operation_spec = {}
+    components_schemas = {}
+    oas_operation = OperationObject(operation_spec)
     first_param = next(iter(signature(handler).parameters), "")
     if first_param in ("self", "request"):
         ignore_params = (first_param,)
@@ -115,7 +186,19 @@ def _add_http_method_to_oas(
         status_code_descriptions = {}
 
     if body_args:
-        multipart = any(robuste_issubclass(type_, UploadedFile) for type_ in body_args.values())
+        # Classify the body arguments in a single pass.
+        properties = {}
+        multipart = False
+        for name, type_ in body_args.items():
+            if robuste_issubclass(type_, UploadedFile):
+                multipart = True
+                properties[name] = {"type": "string", "format": "binary"}
+            else:
+                body_schema = _model_json_schema(type_)
+                if def_sub_schemas := body_schema.pop("$defs", None):
+                    components_schemas.update(def_sub_schemas)
+                properties[name] = body_schema
+
         if multipart:
             # requestBody:
             #   content:
@@ -130,17 +213,6 @@ def _add_http_method_to_oas(
             #           fileName:
             #             type: string
             #             format: binary
-
-            properties = {}
-            for name, type_ in body_args.items():
-                if robuste_issubclass(type_, UploadedFile):
-                    properties[name] = {"type": "string", "format": "binary"}
-                else:
-                    body_schema = type_.model_json_schema(ref_template="#/components/schemas/{model}").copy()
-                    properties[name] = body_schema
-                    if def_sub_schemas := body_schema.pop("$defs", None):
-                        oas.components.schemas.update(def_sub_schemas)
-
             oas_operation.request_body.content = {
                 "multipart/form-data": {
                     "schema": {
@@ -151,58 +223,55 @@ def _add_http_method_to_oas(
             }
 
         else:
-            body_schema = (
-                next(iter(body_args.values()))
-                .model_json_schema(ref_template="#/components/schemas/{model}")
-                .copy()
-            )
-            if def_sub_schemas := body_schema.pop("$defs", None):
-                oas.components.schemas.update(def_sub_schemas)
-
             oas_operation.request_body.content = {
-                "application/json": {"schema": body_schema}
+                "application/json": {"schema": next(iter(properties.values()))}
             }
 
-    indexes = count()
+    parameters = []
     for args_location, args in (
-        ("path", path_args.items()),
-        ("query", qs_args.items()),
-        ("header", header_args.items()),
+        ("path", path_args),
+        ("query", qs_args),
+        ("header", header_args),
     ):
-        for name, type_ in args:
-            i = next(indexes)
-            oas_operation.parameters[i].in_ = args_location
-            oas_operation.parameters[i].name = name
-
-            attrs = {"__annotations__": {"root": type_}}
-            if name in defaults:
-                attrs["root"] = defaults[name]
-                oas_operation.parameters[i].required = False
-            else:
-                oas_operation.parameters[i].required = True
-
-            attr_schema = type(name, (RootModel,), attrs).model_json_schema(
-                ref_template="#/components/schemas/{model}"
-            )
+        for name, type_ in args.items():
+            default = defaults.get(name, _NO_DEFAULT)
+            attr_schema = _parameter_json_schema(name, type_, default)
             if def_sub_schemas := attr_schema.pop("$defs", None):
-                oas.components.schemas.update(def_sub_schemas)
-            oas_operation.parameters[i].schema = attr_schema
+                components_schemas.update(def_sub_schemas)
+            parameters.append(
+                {
+                    "in": args_location,
+                    "name": name,
+                    "required": default is _NO_DEFAULT,
+                    "schema": attr_schema,
+                }
+            )
+    if parameters:
+        oas_operation.parameters = parameters
 
     return_type = get_type_hints(handler).get("return")
     if return_type is not None:
-        _OASResponseBuilder(oas, oas_operation, status_code_descriptions).build(
-            return_type
+        _add_responses_to_oas(
+            components_schemas, oas_operation, status_code_descriptions, return_type
         )
 
+    return operation_spec, components_schemas
+
+
+def _add_http_method_to_oas(
+    components_schemas: dict, oas_path: PathItem, http_method: str, handler
+):
+    operation_spec, sub_schemas = _oas_operation_fragment(handler)
+    oas_operation: OperationObject = getattr(oas_path, http_method.lower())
+    oas_operation.spec.update(deepcopy(operation_spec))
+    components_schemas.update(deepcopy(sub_schemas))
+
 
 def _is_aiohttp_view(obj):
     """
     Return True if obj is a aiohttp View subclass else False.
     """
-    try:
-        return issubclass(obj, View)
-    except TypeError:
-        return False
+    return robuste_issubclass(obj, View)
 
 
 def generate_oas(
@@ -215,6 +284,8 @@ def generate_oas(
     Generate and return Open Api Specification from PydanticView in application.
     """
     oas = OpenApiSpec3()
+    # Sub schemas are collected here and copied in the spec in one update.
+    components_schemas = {}
 
     if version_spec is not None:
         oas.info.version = version_spec
@@ -232,26 +303,29 @@ def generate_oas(
                     info = resource_route.get_info()
                     path = oas.paths[info.get("path", info.get("formatter"))]
                     if resource_route.method == "*":
-                        for method_name in view.allowed_methods:
-                            handler = getattr(view, method_name.lower())
-                            _add_http_method_to_oas(oas, path, method_name, handler)
+                        for method_name, method_attr in view._method_attrs.items():
+                            handler = getattr(view, method_attr)
+                            _add_http_method_to_oas(components_schemas, path, method_name, handler)
                     else:
                         handler = getattr(view, resource_route.method.lower())
-                        _add_http_method_to_oas(oas, path, resource_route.method, handler)
+                        _add_http_method_to_oas(components_schemas, path, resource_route.method, handler)
                 elif _is_aiohttp_view(resource_route.handler):
                     view: View = resource_route.handler
                     info = resource_route.get_info()
                     path = oas.paths[info.get("path", info.get("formatter"))]
                     if resource_route.method == "*":
-                        for method_name in hdrs.METH_ALL:
-                            handler = getattr(view, method_name.lower(), None)
+                        for method_name, method_attr in _METH_ALL_LOWER:
+                            handler = getattr(view, method_attr, None)
                             if handler is not None and getattr(handler, "is_aiohttp_pydantic_handler", False):
-                                _add_http_method_to_oas(oas, path, method_name, handler)
+                                _add_http_method_to_oas(components_schemas, path, method_name, handler)
 
                 elif getattr(resource_route.handler, "is_aiohttp_pydantic_handler", False):
                     info = resource_route.get_info()
                     path = oas.paths[info.get("path", info.get("formatter"))]
-                    _add_http_method_to_oas(oas, path, resource_route.method, resource_route.handler)
+                    _add_http_method_to_oas(components_schemas, path, resource_route.method, resource_route.handler)
+
+    if components_schemas:
+        oas.components.schemas.update(components_schemas)
 
     if security:
         oas.components.security_schemes.update(security)
@@ -269,15 +343,27 @@ def _app_key_or_string(app, app_key, str_key):
     return app[str_key]
 
 
+def _generate_oas_from_app(app):
+    apps = _app_key_or_string(app, key_apps_to_expose, "apps to expose")
+    version_spec = _app_key_or_string(app, key_version_spec, "version spec")
+    title_spec = _app_key_or_string(app, key_title_spec, "title spec")
+    security = _app_key_or_string(app, key_security, "security")
+    return generate_oas(apps, version_spec, title_spec, security)
+
+
 async def get_oas(request):
     """
     View to generate the Open Api Specification from PydanticView in application.
+
+    The routes cannot change once the application is running, the specification
+    is generated on the first request and stored in app[key_spec].
     """
-    apps = _app_key_or_string(request.app, key_apps_to_expose, "apps to expose")
-    version_spec = _app_key_or_string(request.app, key_version_spec, "version spec")
-    title_spec = _app_key_or_string(request.app, key_title_spec, "title spec")
-    security = _app_key_or_string(request.app, key_security, "security")
-    return json_response(generate_oas(apps, version_spec, title_spec, security))
+    spec = request.app.get(key_spec)
+    if spec is None:
+        return json_response(_generate_oas_from_app(request.app))
+    if not spec:
+        spec.update(_generate_oas_from_app(request.app))
+    return json_response(spec)
 
 
 async def oas_ui(request):
@@ -15,19 +15,19 @@ class StrictOrderedMultipartReader:
 
     def __init__(self, reader: MultipartReader, part_names: List[str]):
         self._reader = reader
-        self._expected_part_names = part_names[::-1]
+        self._expected_part_names = tuple(part_names)
+        self._next_index = 0
 
     async def next_part(self, part_name):
         # Check Programing Error
-        try:
-            expected_part_name = self._expected_part_names.pop()
-        except ImportError:
+        if self._next_index >= len(self._expected_part_names):
             raise MultipartReadingError(
                 f'Try to read a not expected part "{part_name}" in the multipart request'
             )
 
+        expected_part_name = self._expected_part_names[self._next_index]
         if expected_part_name != part_name:
-            if part_name in self._expected_part_names:
+            if part_name in self._expected_part_names[self._next_index + 1:]:
                 raise MultipartReadingError(
                     f'Try to read part "{part_name}" before "{expected_part_name}" in the multipart request'
                 )
@@ -35,6 +35,7 @@ class StrictOrderedMultipartReader:
                 raise MultipartReadingError(
                     f'Try to read a not expected part "{part_name}" in the multipart request'
                 )
+        self._next_index += 1
 
         # Validate multipart request contents.
         if (part := await self._reader.next()) is None:
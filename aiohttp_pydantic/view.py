@@ -1,6 +1,6 @@
 from functools import update_wrapper
 from inspect import iscoroutinefunction
-from typing import Any, Callable, Generator, Iterable, Set, ClassVar
+from typing import Any, Callable, Dict, FrozenSet, Generator, Iterable, ClassVar
 import warnings
 
 from aiohttp.abc import AbstractView
@@ -20,6 +20,10 @@ from .injectors import (
     CONTEXT,
     Group,
 )
+from .utils import robuste_issubclass
+
+# (METHOD, method) pairs, handlers are looked up using the lower case name.
+_METH_ALL_LOWER = tuple((meth_name, meth_name.lower()) for meth_name in METH_ALL)
 
 
 class PydanticView(AbstractView):
@@ -28,12 +32,16 @@ class PydanticView(AbstractView):
     """
 
     # Allowed HTTP methods; overridden when subclassed.
-    allowed_methods: ClassVar[Set[str]] = {}
+    allowed_methods: ClassVar[FrozenSet[str]] = frozenset()
+
+    # Handler attribute name of each allowed HTTP method, {"GET": "get"};
+    # overridden when subclassed.
+    _method_attrs: ClassVar[Dict[str, str]] = {}
 
     async def _iter(self) -> StreamResponse:
-        if (method_name := self.request.method) not in self.allowed_methods:
+        if (meth_attr := self._method_attrs.get(self.request.method)) is None:
             self._raise_allowed_methods()
-        return await getattr(self, method_name.lower())()
+        return await getattr(self, meth_attr)()
 
     def __await__(self) -> Generator[Any, None, StreamResponse]:
         return self._iter().__await__()
@@ -46,19 +54,27 @@ class PydanticView(AbstractView):
         defined in aiohttp.View parent class is decorated.
         """
 
-        cls.allowed_methods = {
-            meth_name for meth_name in METH_ALL if hasattr(cls, meth_name.lower())
-        }
+        cls.allowed_methods = frozenset(
+            meth_name
+            for meth_name, meth_attr in _METH_ALL_LOWER
+            if hasattr(cls, meth_attr)
+        )
 
-        for meth_name in METH_ALL:
-            if meth_name.lower() in vars(cls):
-                handler = getattr(cls, meth_name.lower())
+        for meth_name, meth_attr in _METH_ALL_LOWER:
+            if meth_attr in vars(cls):
+                handler = getattr(cls, meth_attr)
                 # FUTURE: remove cls.parse_func_signature, cls._parse_func_signature
                 #   remove in this module inject_params, _inject_params and use:
                 #   from .decorator import inject_params
                 #   decorated_handler = inject_params.in_method(handler)
                 decorated_handler = _inject_params(handler, cls._parse_func_signature)
-                setattr(cls, meth_name.lower(), decorated_handler)
+                setattr(cls, meth_attr, decorated_handler)
+
+        cls._method_attrs = {
+            meth_name: meth_attr
+            for meth_name, meth_attr in _METH_ALL_LOWER
+            if meth_name in cls.allowed_methods
+        }
 
     def _raise_allowed_methods(self) -> None:
         raise HTTPMethodNotAllowed(self.request.method, self.allowed_methods)
@@ -135,21 +151,35 @@ def _inject_params(
     handler, parse_func_signature: Callable[[Callable], Iterable[AbstractInjector]]
 ):
 
-    injectors = parse_func_signature(handler)
+    # The bound inject method, the context and whether the injector is a
+    # coroutine are known at decoration time, they are not looked up for
+    # each request.
+    injectors = [
+        (injector.inject, injector.context, iscoroutinefunction(injector.inject))
+        for injector in parse_func_signature(handler)
+    ]
+
+    if not injectors:
+
+        async def wrapped_handler(self):
+            return await handler(self)
+
+    else:
 
-    async def wrapped_handler(self):
-        args = []
-        kwargs = {}
-        for injector in injectors:
+        async def wrapped_handler(self):
+            args = []
+            kwargs = {}
+            request = self.request
             try:
-                if iscoroutinefunction(injector.inject):
-                    await injector.inject(self.request, args, kwargs)
-                else:
-                    injector.inject(self.request, args, kwargs)
+                for inject, context, is_coroutine in injectors:
+                    if is_coroutine:
+                        await inject(request, args, kwargs)
+                    else:
+                        inject(request, args, kwargs)
             except ValidationError as error:
-                return await self.on_validation_error(error, injector.context)
+                return await self.on_validation_error(error, context)
 
-        return await handler(self, *args, **kwargs)
+            return await handler(self, *args, **kwargs)
 
     update_wrapper(wrapped_handler, handler)
     return wrapped_handler
@@ -159,10 +189,7 @@ def is_pydantic_view(obj) -> bool:
     """
     Return True if obj is a PydanticView subclass else False.
     """
-    try:
-        return issubclass(obj, PydanticView)
-    except TypeError:
-        return False
+    return robuste_issubclass(obj, PydanticView)
 
 
 __all__ = (
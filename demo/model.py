@@ -35,20 +35,17 @@ class Model:
         self.storage[pet.id] = pet
 
     def remove_pet(self, id: int):
-        try:
-            del self.storage[id]
-        except KeyError as error:
-            raise self.NotFound(str(error))
+        if self.storage.pop(id, None) is None:
+            raise self.NotFound(str(id))
 
     def update_pet(self, id: int, pet: Pet):
         self.remove_pet(id)
         self.add_pet(pet)
 
     def find_pet(self, id: int):
-        try:
-            return self.storage[id]
-        except KeyError as error:
-            raise self.NotFound(str(error))
+        if (pet := self.storage.get(id)) is None:
+            raise self.NotFound(str(id))
+        return pet
 
     def list_pets(self):
         return list(self.storage.values())
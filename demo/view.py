@@ -17,9 +17,9 @@ class PetCollectionView(PydanticView):
             200: Successful operation
         """
         pets = self.request.app["model"].list_pets()
-        return web.json_response(
-            [pet.model_dump() for pet in pets if age is None or age == pet.age]
-        )
+        if age is not None:
+            pets = [pet for pet in pets if pet.age == age]
+        return web.json_response([pet.model_dump() for pet in pets])
 
     async def post(self, pet: Pet) -> r201[Pet]:
         """
@@ -45,7 +45,7 @@ class PetItemView(PydanticView):
             default: Unexpected error
         """
         pet = self.request.app["model"].find_pet(id)
-        return web.json_response(pet.dict())
+        return web.json_response(pet.model_dump())
 
     async def put(self, id: int, /, pet: Pet) -> r200[Pet]:
         """
@@ -56,7 +56,7 @@ class PetItemView(PydanticView):
             404: Pet not found
         """
         self.request.app["model"].update_pet(id, pet)
-        return web.json_response(pet.dict())
+        return web.json_response(pet.model_dump())
 
     async def delete(self, id: int, /) -> r204:
         """
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from aiohttp import web
+
+from aiohttp_pydantic import PydanticView
+from aiohttp_pydantic.decorator import inject_params
+import pytest
+
+
+class PingView(PydanticView):
+    async def get(self):
+        return web.json_response({"ping": "pong"})
+
+
+class PingAiohttpView(web.View):
+    @inject_params.in_method
+    async def get(self):
+        return web.json_response({"ping": "pong"})
+
+
+@inject_params
+async def ping():
+    return web.json_response({"ping": "pong"})
+
+
+@inject_params.and_request
+async def ping_with_request(request):
+    return web.json_response({"ping": request.method})
+
+
+def build_app_with_pydantic_view():
+    app = web.Application()
+    app.router.add_view("/ping", PingView)
+    return app
+
+
+def build_app_with_aiohttp_view():
+    app = web.Application()
+    app.router.add_view("/ping", PingAiohttpView)
+    return app
+
+
+def build_app_with_decorated_handler():
+    app = web.Application()
+    app.router.add_get("/ping", ping)
+    return app
+
+
+@pytest.mark.parametrize(
+    "app_builder",
+    [
+        build_app_with_pydantic_view,
+        build_app_with_aiohttp_view,
+        build_app_with_decorated_handler,
+    ],
+    ids=["pydantic view", "aiohttp view", "decorated handler"],
+)
+async def test_handler_without_parameters_should_be_called(
+    app_builder, aiohttp_client, event_loop
+):
+    client = await aiohttp_client(app_builder())
+    resp = await client.get("/ping")
+    assert resp.status == 200
+    assert await resp.json() == {"ping": "pong"}
+
+
+async def test_handler_with_only_request_should_receive_the_request(
+    aiohttp_client, event_loop
+):
+    app = web.Application()
+    app.router.add_get("/ping", ping_with_request)
+    client = await aiohttp_client(app)
+    resp = await client.get("/ping")
+    assert resp.status == 200
+    assert await resp.json() == {"ping": "GET"}
@@ -71,3 +71,12 @@ def test_allowed_methods_are_set_correctly():
             pass
 
     assert ChildView.allowed_methods == {"POST", "PUT", "GET"}
+    assert isinstance(ChildView.allowed_methods, frozenset)
+
+
+def test_method_attrs_map_allowed_methods_to_handler_names():
+    class ChildView(AiohttpViewParent, PydanticViewParent):
+        async def post(self, id: int, /):
+            pass
+
+    assert ChildView._method_attrs == {"GET": "get", "POST": "post", "PUT": "put"}
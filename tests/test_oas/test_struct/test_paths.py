@@ -145,3 +145,15 @@ def test_paths_operation_responses():
             }
         }
     }
+
+
+def test_paths_operation_parameters_setter():
+    oas = OpenApiSpec3()
+    operation = oas.paths["/users/{petId}"].get
+    operation.parameters = [{"in": "path", "name": "petId", "required": True}]
+    operation.parameters[1].name = "format"
+
+    assert oas.spec["paths"]["/users/{petId}"]["get"]["parameters"] == [
+        {"in": "path", "name": "petId", "required": True},
+        {"name": "format"},
+    ]
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import gc
+import weakref
+from copy import deepcopy
 from typing import List
 
 import pytest
@@ -10,6 +13,7 @@ import pydantic_core
 from aiohttp_pydantic import PydanticView, oas
 from aiohttp_pydantic.injectors import Group
 from aiohttp_pydantic.oas.typing import r200
+from aiohttp_pydantic.uploaded_file import UploadedFile
 import aiohttp_pydantic.oas.view
 from .bench.model import Pet
 from .bench import decorated_handler, pydantic_view, decorated_handler_with_request, view
@@ -424,3 +428,179 @@ async def test_use_parameters_group_should_not_impact_the_oas(aiohttp_client):
     assert await ensure_content_durability(await aiohttp_client(app1)) == await ensure_content_durability(
         await aiohttp_client(app2)
     )
+
+
+async def test_oas_should_be_generated_once(aiohttp_client, monkeypatch):
+    calls = []
+    generate_oas = aiohttp_pydantic.oas.view.generate_oas
+
+    def counting_generate_oas(*args, **kwargs):
+        calls.append(args)
+        return generate_oas(*args, **kwargs)
+
+    monkeypatch.setattr(aiohttp_pydantic.oas.view, "generate_oas", counting_generate_oas)
+    client = await aiohttp_client(pydantic_view.build_app())
+    assert len(calls) == 0
+
+    await ensure_content_durability(client)
+    assert len(calls) == 1
+
+
+async def test_failed_oas_generation_should_be_retried_on_next_request(
+    aiohttp_client, monkeypatch
+):
+    def broken_generate_oas(*args, **kwargs):
+        raise TypeError("unsupported annotation")
+
+    monkeypatch.setattr(aiohttp_pydantic.oas.view, "generate_oas", broken_generate_oas)
+    client = await aiohttp_client(pydantic_view.build_app())
+
+    response = await client.get("/oas/spec")
+    assert response.status == 500
+
+    monkeypatch.undo()
+    await ensure_content_durability(client)
+
+
+def test_generated_oas_should_not_share_dicts_between_calls():
+    class PetItemView(PydanticView):
+        async def get(self, id: int, /, size: int = 1) -> r200[Pet]:
+            return web.json_response()
+
+    app = web.Application()
+    app.router.add_view("/pets/{id}", PetItemView)
+
+    spec_1 = aiohttp_pydantic.oas.view.generate_oas([app])
+    expected = deepcopy(spec_1)
+    spec_1["paths"]["/pets/{id}"]["get"]["parameters"][0]["schema"]["type"] = "string"
+    spec_1["paths"]["/pets/{id}"]["get"]["responses"]["200"]["content"].clear()
+    spec_1["components"]["schemas"]["Color"]["enum"].append("blue")
+
+    spec_2 = aiohttp_pydantic.oas.view.generate_oas([app])
+    assert spec_2 == expected
+
+
+def test_equal_defaults_of_different_types_should_have_their_own_schema():
+    class BoolView(PydanticView):
+        async def get(self, flag: bool = True) -> r200[Pet]:
+            return web.json_response()
+
+    class IntView(PydanticView):
+        async def get(self, flag: int = 1) -> r200[Pet]:
+            return web.json_response()
+
+    app = web.Application()
+    app.router.add_view("/bool", BoolView)
+    app.router.add_view("/int", IntView)
+
+    spec = aiohttp_pydantic.oas.view.generate_oas([app])
+    assert spec["paths"]["/bool"]["get"]["parameters"][0]["schema"] == {
+        "default": True,
+        "title": "flag",
+        "type": "boolean",
+    }
+    assert spec["paths"]["/int"]["get"]["parameters"][0]["schema"] == {
+        "default": 1,
+        "title": "flag",
+        "type": "integer",
+    }
+
+
+def test_multipart_body_should_list_models_and_files_in_order():
+    class PetPhotoView(PydanticView):
+        async def post(self, pet: Pet, photo: UploadedFile) -> r200[Pet]:
+            return web.json_response()
+
+    app = web.Application()
+    app.router.add_view("/pets", PetPhotoView)
+
+    spec = aiohttp_pydantic.oas.view.generate_oas([app])
+    content = spec["paths"]["/pets"]["post"]["requestBody"]["content"]
+    assert list(content) == ["multipart/form-data"]
+    properties = content["multipart/form-data"]["schema"]["properties"]
+    assert list(properties) == ["pet", "photo"]
+    assert properties["pet"]["title"] == "Pet"
+    assert properties["photo"] == {"type": "string", "format": "binary"}
+    assert "Toy" in spec["components"]["schemas"]
+
+
+def test_generate_oas_should_not_keep_views_alive():
+    class PetItemView(PydanticView):
+        async def get(self, id: int, /) -> r200[Pet]:
+            return web.json_response()
+
+    app = web.Application()
+    app.router.add_view("/pets/{id}", PetItemView)
+    first_spec = aiohttp_pydantic.oas.view.generate_oas([app])
+    assert aiohttp_pydantic.oas.view.generate_oas([app]) == first_spec
+
+    view_ref = weakref.ref(PetItemView)
+    handler_ref = weakref.ref(PetItemView.get)
+    del app, PetItemView
+    gc.collect()
+    assert view_ref() is None
+    assert handler_ref() is None
+
+
+def test_handlers_with_the_same_docstring_should_have_their_own_sections():
+    class PetView(PydanticView):
+        async def get(self) -> r200[Pet]:
+            """
+            Find a pet
+
+            Tags: pet
+            Security: APIKeyHeader
+            Status Codes:
+                200: The pet is found
+            """
+            return web.json_response()
+
+    class CatView(PetView):
+        pass
+
+    app = web.Application()
+    app.router.add_view("/pets", PetView)
+    app.router.add_view("/cats", CatView)
+
+    spec = aiohttp_pydantic.oas.view.generate_oas([app])
+    pet_spec = spec["paths"]["/pets"]["get"]
+    cat_spec = spec["paths"]["/cats"]["get"]
+    assert pet_spec["security"] == [{"APIKeyHeader": []}]
+    assert pet_spec["tags"] == ["pet"]
+    assert pet_spec["responses"]["200"]["description"] == "The pet is found"
+    assert cat_spec == pet_spec
+    assert cat_spec["security"] is not pet_spec["security"]
+
+
+def test_oas_should_describe_the_method_of_each_route():
+    class PetView(PydanticView):
+        async def get(self) -> r200[Pet]:
+            return web.json_response()
+
+        async def post(self, pet: Pet) -> r200[Pet]:
+            return web.json_response()
+
+    app = web.Application()
+    app.router.add_view("/pets", PetView)
+    app.router.add_route("GET", "/get-only", PetView)
+
+    spec = aiohttp_pydantic.oas.view.generate_oas([app])
+    assert sorted(spec["paths"]["/pets"]) == ["get", "post"]
+    assert list(spec["paths"]["/get-only"]) == ["get"]
+    assert spec["paths"]["/get-only"]["get"] == spec["paths"]["/pets"]["get"]
+
+
+def test_oas_should_describe_a_handler_patched_after_class_definition(monkeypatch):
+    class PetView(PydanticView):
+        async def get(self) -> r200[Pet]:
+            return web.json_response()
+
+    async def patched_get(self, name: str) -> r200[Pet]:
+        return web.json_response()
+
+    monkeypatch.setattr(PetView, "get", patched_get)
+    app = web.Application()
+    app.router.add_view("/pets", PetView)
+
+    spec = aiohttp_pydantic.oas.view.generate_oas([app])
+    assert [p["name"] for p in spec["paths"]["/pets"]["get"]["parameters"]] == ["name"]
@@ -0,0 +1,20 @@
+from abc import ABC
+
+from aiohttp_pydantic.utils import robuste_issubclass
+
+
+def test_robuste_issubclass_should_return_false_if_obj_is_not_a_class():
+    assert robuste_issubclass("str", str) is False
+    assert robuste_issubclass([], list) is False
+
+
+def test_robuste_issubclass_should_see_classes_registered_later():
+    class Base(ABC):
+        pass
+
+    class Virtual:
+        pass
+
+    assert robuste_issubclass(Virtual, Base) is False
+    Base.register(Virtual)
+    assert robuste_issubclass(Virtual, Base) is True
@@ -176,3 +176,73 @@ async def test_post_a_valid_article_should_return_the_parsed_type(
     assert resp.status == 200
     assert resp.content_type == "application/json"
     assert await resp.json() == {"name": "foo", "nb_page": 3}
+
+
+class AuthorArticleView(PydanticView):
+    async def post(
+        self, author_id: int, /, article: ArticleModel, draft: bool = False, *, x_user: str
+    ):
+        return web.json_response(
+            {
+                "author_id": author_id,
+                "article": article.model_dump(),
+                "draft": draft,
+                "user": x_user,
+            }
+        )
+
+
+@inject_params
+async def post_author_article(
+    author_id: int, /, article: ArticleModel, draft: bool = False, *, x_user: str
+):
+    return web.json_response(
+        {
+            "author_id": author_id,
+            "article": article.model_dump(),
+            "draft": draft,
+            "user": x_user,
+        }
+    )
+
+
+def build_app_with_pydantic_view_2():
+    app = web.Application()
+    app.router.add_view("/author/{author_id}/article", AuthorArticleView)
+    return app
+
+
+def build_app_with_decorated_handler_2():
+    app = web.Application()
+    app.router.add_post("/author/{author_id}/article", post_author_article)
+    return app
+
+
+app_builders_2 = [build_app_with_pydantic_view_2, build_app_with_decorated_handler_2]
+
+
+@pytest.mark.parametrize(
+    "app_builder", app_builders_2, ids=["pydantic view", "decorated handler"]
+)
+async def test_body_should_be_injected_with_path_query_and_headers(
+    app_builder, aiohttp_client, event_loop
+):
+    client = await aiohttp_client(app_builder())
+    resp = await client.post(
+        "/author/7/article?draft=true",
+        json={"name": "foo", "nb_page": 3},
+        headers={"X-User": "bob"},
+    )
+    assert resp.status == 200
+    assert await resp.json() == {
+        "author_id": 7,
+        "article": {"name": "foo", "nb_page": 3},
+        "draft": True,
+        "user": "bob",
+    }
+
+    resp = await client.post(
+        "/author/7/article", json={"name": "foo"}, headers={"X-User": "bob"}
+    )
+    assert resp.status == 400
+    assert (await resp.json())[0]["in"] == "body"
@@ -8,7 +8,11 @@ from aiohttp_pydantic import PydanticView
 from aiohttp_pydantic.decorator import inject_params
 import pytest
 
-from aiohttp_pydantic.uploaded_file import UploadedFile, MultipartReadingError
+from aiohttp_pydantic.uploaded_file import (
+    MultipartReadingError,
+    StrictOrderedMultipartReader,
+    UploadedFile,
+)
 
 
 class BookModel(BaseModel):
@@ -322,3 +326,25 @@ async def test_error_handler_definition(event_loop):
         str(e_info.value)
         == 'You cannot define a pydantic.BaseModel argument after an UploadedFile argument. (The argument "book" must be defined before "page_1")'
     )
+
+
+async def test_strict_ordered_multipart_reader_should_reject_not_expected_part(event_loop):
+    reader = StrictOrderedMultipartReader(None, ["page_1"])
+    with pytest.raises(MultipartReadingError) as e_info:
+        await reader.next_part("page_3")
+
+    assert (
+        str(e_info.value)
+        == 'Try to read a not expected part "page_3" in the multipart request'
+    )
+
+
+async def test_strict_ordered_multipart_reader_should_reject_part_when_all_parts_are_read(event_loop):
+    reader = StrictOrderedMultipartReader(None, [])
+    with pytest.raises(MultipartReadingError) as e_info:
+        await reader.next_part("page_1")
+
+    assert (
+        str(e_info.value)
+        == 'Try to read a not expected part "page_1" in the multipart request'
+    )
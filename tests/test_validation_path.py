@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from unittest import mock
+
 from aiohttp import web
 
 from aiohttp_pydantic import PydanticView
@@ -64,3 +66,23 @@ async def test_get_article_with_wrong_path_parameters_should_return_error(
             "type": "int_parsing",
         }
     ]
+
+
+async def test_not_allowed_method_should_return_405(aiohttp_client, event_loop):
+    client = await aiohttp_client(build_app_with_pydantic_view())
+    resp = await client.post("/article/1234/tag/music/before/1980")
+    assert resp.status == 405
+    assert resp.headers["Allow"] == "GET"
+
+
+async def test_handler_patched_after_class_definition_should_be_called(
+    aiohttp_client, event_loop
+):
+    async def fake_get(self):
+        return web.json_response({"fake": True})
+
+    client = await aiohttp_client(build_app_with_pydantic_view())
+    with mock.patch.object(ArticleView, "get", fake_get):
+        resp = await client.get("/article/1234/tag/music/before/1980")
+    assert resp.status == 200
+    assert await resp.json() == {"fake": True}